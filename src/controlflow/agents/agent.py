@@ -2,6 +2,7 @@ import abc
 import logging
 import random
 import warnings
+import weakref
 from contextlib import AbstractContextManager, contextmanager
 from typing import (
     TYPE_CHECKING,
@@ -52,6 +53,10 @@ if TYPE_CHECKING:
     from controlflow.stream import Stream
 logger = logging.getLogger(__name__)
 
+# converted tools for each agent, keyed by the agent's identity (not its
+# content-based hash) and stored with the inputs they were built from
+_tools_cache: dict[int, tuple[tuple, tuple[Tool, ...]]] = {}
+
 
 class Agent(ControlFlowModel, abc.ABC):
     """
@@ -124,7 +129,9 @@ class Agent(ControlFlowModel, abc.ABC):
             self.id = self._generate_id()
 
     def __hash__(self) -> int:
-        return id(self)
+        # the ID is derived from the agent's content, so equal agents share a
+        # hash, and it doesn't change when other fields are mutated in place
+        return hash(self.id)
 
     def _generate_id(self):
         """
@@ -194,13 +201,27 @@ class Agent(ControlFlowModel, abc.ABC):
     def get_tools(self) -> list["Tool"]:
         from controlflow.tools.input import cli_input
 
-        tools = self.tools.copy()
-        if self.interactive:
-            tools.append(cli_input)
-        for memory in self.memories:
-            tools.extend(memory.get_tools())
-
-        return as_tools(tools)
+        # converting memory methods to tools generates schemas, so the result
+        # is cached until the agent's tools, memories, or interactivity change
+        # (stored outside the model so it doesn't affect equality)
+        cache_key = (
+            tuple(id(t) for t in self.tools),
+            tuple((id(m), m.key) for m in self.memories),
+            self.interactive,
+        )
+        cached = _tools_cache.get(id(self))
+        if cached is None:
+            weakref.finalize(self, _tools_cache.pop, id(self), None)
+        if cached is None or cached[0] != cache_key:
+            tools = self.tools.copy()
+            if self.interactive:
+                tools.append(cli_input)
+            for memory in self.memories:
+                tools.extend(memory.get_tools())
+            cached = (cache_key, tuple(as_tools(tools)))
+            _tools_cache[id(self)] = cached
+
+        return list(cached[1])
 
     def get_prompt(self) -> str:
         from controlflow.orchestration import prompt_templates
@@ -3,12 +3,16 @@ import functools
 import inspect
 from typing import Any, Callable, Optional, Union
 
+import prefect
 from prefect.utilities.asyncutils import run_coro_as_sync
 
 import controlflow
 from controlflow.agents import Agent
 from controlflow.flows import Flow
 from controlflow.tasks.task import Task
+from controlflow.tools.tools import as_tools
+from controlflow.utilities.cache import task_cache_key, task_result_cache
+from controlflow.utilities.general import NOTSET
 from controlflow.utilities.logging import get_logger
 from controlflow.utilities.prefect import prefect_flow, prefect_task
 
@@ -17,6 +21,81 @@ from controlflow.utilities.prefect import prefect_flow, prefect_task
 logger = get_logger(__name__)
 
 
+def _arguments_binder(fn: Callable) -> Callable[..., dict[str, Any]]:
+    """
+    Generates a function with the same parameters as `fn` that returns its
+    arguments as a dict of parameter names and values, with defaults applied.
+    This is equivalent to `Signature.bind` + `apply_defaults()`, but binding is
+    done by the interpreter. The generated function carries `fn`'s name, so
+    binding errors refer to `fn`.
+    """
+    sig = inspect.signature(fn)
+    params = []
+    defaults = []
+    prev_kind = None
+    for name, param in sig.parameters.items():
+        if prev_kind is param.POSITIONAL_ONLY and param.kind is not prev_kind:
+            params.append("/")
+        if param.kind is param.KEYWORD_ONLY and prev_kind not in (
+            param.KEYWORD_ONLY,
+            param.VAR_POSITIONAL,
+        ):
+            params.append("*")
+
+        if param.kind is param.VAR_POSITIONAL:
+            params.append(f"*{name}")
+        elif param.kind is param.VAR_KEYWORD:
+            params.append(f"**{name}")
+        elif param.default is param.empty:
+            params.append(name)
+        else:
+            params.append(f"{name}=_defaults[{len(defaults)}]")
+            defaults.append(param.default)
+        prev_kind = param.kind
+    if prev_kind is inspect.Parameter.POSITIONAL_ONLY:
+        params.append("/")
+
+    arguments = ", ".join(f"{name!r}: {name}" for name in sig.parameters)
+    source = (
+        f"def bind_arguments({', '.join(params)}):\n    return {{{arguments}}}\n"
+    )
+    namespace = {"_defaults": tuple(defaults)}
+    exec(compile(source, "<controlflow bind_arguments>", "exec"), namespace)
+    bind_arguments = namespace["bind_arguments"]
+
+    # argument errors are reported with the code's qualname on Python 3.11+,
+    # the function's qualname on 3.10, and the code's name before that
+    code_names = {"co_name": fn.__name__}
+    if hasattr(bind_arguments.__code__, "co_qualname"):
+        code_names["co_qualname"] = fn.__qualname__
+    bind_arguments.__code__ = bind_arguments.__code__.replace(**code_names)
+    bind_arguments.__name__ = fn.__name__
+    bind_arguments.__qualname__ = fn.__qualname__
+    return bind_arguments
+
+
+# options copied from a Prefect flow passed to the `flow` decorator, mapping
+# Flow attributes to `prefect.flow` kwargs
+_PREFECT_FLOW_OPTIONS = {
+    "name": "name",
+    "version": "version",
+    "flow_run_name": "flow_run_name",
+    "description": "description",
+    "log_prints": "log_prints",
+    "task_runner": "task_runner",
+    "persist_result": "persist_result",
+    "result_storage": "result_storage",
+    "result_serializer": "result_serializer",
+    "cache_result_in_memory": "cache_result_in_memory",
+    "should_validate_parameters": "validate_parameters",
+    "on_completion_hooks": "on_completion",
+    "on_failure_hooks": "on_failure",
+    "on_cancellation_hooks": "on_cancellation",
+    "on_crashed_hooks": "on_crashed",
+    "on_running_hooks": "on_running",
+}
+
+
 def flow(
     fn: Optional[Callable[..., Any]] = None,
     *,
@@ -44,6 +123,8 @@ def flow(
     Args:
         fn (callable, optional): The function to be wrapped as a flow. If not provided,
             the decorator will act as a partial function and return a new flow decorator.
+            If `fn` is already a Prefect flow, its function is wrapped and its options
+            are preserved, rather than running it as a nested flow.
         thread (str, optional): The thread to execute the flow on. Defaults to None.
         instructions (str, optional): Instructions for the flow. Defaults to None.
         tools (list[Callable], optional): List of tools to be used in the flow. Defaults to None.
@@ -67,7 +148,26 @@ def flow(
             **kwargs,
         )
 
-    sig = inspect.signature(fn)
+    # if fn is already a Prefect flow, wrap its function directly instead of
+    # nesting one flow run inside another, and carry over its options
+    if isinstance(fn, prefect.Flow):
+        flow_options = {
+            kwarg: getattr(fn, attr, None)
+            for attr, kwarg in _PREFECT_FLOW_OPTIONS.items()
+        }
+        prefect_kwargs = {
+            **{k: v for k, v in flow_options.items() if v not in (None, [])},
+            **(prefect_kwargs or {}),
+        }
+        if retries is None:
+            retries = fn.retries
+        if retry_delay_seconds is None:
+            retry_delay_seconds = fn.retry_delay_seconds
+        if timeout_seconds is None:
+            timeout_seconds = fn.timeout_seconds
+        fn = fn.fn
+
+    bind_arguments = _arguments_binder(fn)
 
     def create_flow_context(bound_args):
         flow_kwargs = kwargs.copy()
@@ -93,10 +193,8 @@ def flow(
 
         @functools.wraps(fn)
         async def wrapper(*wrapper_args, **wrapper_kwargs):
-            bound = sig.bind(*wrapper_args, **wrapper_kwargs)
-            bound.apply_defaults()
             with (
-                create_flow_context(bound.arguments),
+                create_flow_context(bind_arguments(*wrapper_args, **wrapper_kwargs)),
                 controlflow.instructions(instructions),
             ):
                 return await fn(*wrapper_args, **wrapper_kwargs)
@@ -104,10 +202,8 @@ def flow(
 
         @functools.wraps(fn)
         def wrapper(*wrapper_args, **wrapper_kwargs):
-            bound = sig.bind(*wrapper_args, **wrapper_kwargs)
-            bound.apply_defaults()
             with (
-                create_flow_context(bound.arguments),
+                create_flow_context(bind_arguments(*wrapper_args, **wrapper_kwargs)),
                 controlflow.instructions(instructions),
             ):
                 return fn(*wrapper_args, **wrapper_kwargs)
@@ -133,6 +229,8 @@ def task(
     retries: Optional[int] = None,
     retry_delay_seconds: Optional[Union[float, int]] = None,
     timeout_seconds: Optional[Union[float, int]] = None,
+    cacheable: bool = False,
+    cache_ttl: Optional[float] = None,
     **task_kwargs: Optional[dict[str, Any]],
 ):
     """
@@ -152,6 +250,11 @@ def task(
         agents (list[Agent], optional): List of agents to be used in the task. Defaults to None.
         tools (list[Callable], optional): List of tools to be used in the task. Defaults to None.
         interactive (bool, optional): Whether the task requires human interaction or input during its execution. Defaults to None, in which case it is set to False.
+        cacheable (bool, optional): If True, results are cached by objective, instructions,
+            context, result type, tools, and agents, and repeated calls with the same inputs
+            return the cached result without running the task. Defaults to False.
+        cache_ttl (float, optional): The number of seconds a cached result is valid for. Defaults
+            to None, in which case cached results do not expire.
 
     Returns:
         callable: The wrapped function or a new task decorator if `fn` is not provided.
@@ -169,10 +272,12 @@ def task(
             retries=retries,
             retry_delay_seconds=retry_delay_seconds,
             timeout_seconds=timeout_seconds,
+            cacheable=cacheable,
+            cache_ttl=cache_ttl,
             **task_kwargs,
         )
 
-    sig = inspect.signature(fn)
+    bind_arguments = _arguments_binder(fn)
 
     if name is None:
         name = fn.__name__
@@ -182,11 +287,13 @@ def task(
 
     result_type = fn.__annotations__.get("return")
 
-    def _get_task(*args, **kwargs) -> Task:
+    # resolved once so that each call doesn't reconvert tools or allocate defaults
+    task_interactive = interactive or False
+    task_tools = as_tools(tools or [])
+
+    def _get_context(*args, **kwargs) -> dict[str, Any]:
         # first process callargs
-        bound = sig.bind(*args, **kwargs)
-        bound.apply_defaults()
-        context = bound.arguments.copy()
+        context = bind_arguments(*args, **kwargs)
 
         # call the function to see if it produces an updated objective
         maybe_coro = fn(*args, **kwargs)
@@ -196,7 +303,9 @@ def task(
             result = maybe_coro
         if result is not None:
             context["Additional context"] = result
+        return context
 
+    def _create_task(context: dict[str, Any]) -> Task:
         return Task(
             objective=objective,
             instructions=instructions,
@@ -204,8 +313,24 @@ def task(
             agents=agents,
             context=context,
             result_type=result_type,
-            interactive=interactive or False,
-            tools=tools or [],
+            interactive=task_interactive,
+            tools=task_tools,
+            **task_kwargs,
+        )
+
+    def _get_task(*args, **kwargs) -> Task:
+        return _create_task(_get_context(*args, **kwargs))
+
+    def _cache_key(context: dict[str, Any]) -> str:
+        return task_cache_key(
+            objective=objective,
+            name=f"{fn.__module__}.{fn.__qualname__}:{name}",
+            instructions=instructions,
+            context=context,
+            result_type=result_type,
+            tools=task_tools,
+            agents=agents,
+            interactive=task_interactive,
             **task_kwargs,
         )
 
@@ -213,14 +338,30 @@ def task(
 
         @functools.wraps(fn)
         async def wrapper(*args, **kwargs):
-            task = _get_task(*args, **kwargs)
-            return await task.run_async()
+            context = _get_context(*args, **kwargs)
+            if not cacheable:
+                return await _create_task(context).run_async()
+
+            key = _cache_key(context)
+            result = task_result_cache.get(key, NOTSET)
+            if result is NOTSET:
+                result = await _create_task(context).run_async()
+                task_result_cache.put(key, result, ttl=cache_ttl)
+            return result
     else:
 
         @functools.wraps(fn)
         def wrapper(*args, **kwargs):
-            task = _get_task(*args, **kwargs)
-            return task.run()
+            context = _get_context(*args, **kwargs)
+            if not cacheable:
+                return _create_task(context).run()
+
+            key = _cache_key(context)
+            result = task_result_cache.get(key, NOTSET)
+            if result is NOTSET:
+                result = _create_task(context).run()
+                task_result_cache.put(key, result, ttl=cache_ttl)
+            return result
 
     wrapper = prefect_task(
         timeout_seconds=timeout_seconds,
@@ -1,8 +1,7 @@
+import sys
 import textwrap
 from typing import Any, Optional, Union
 
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import AzureChatOpenAI, ChatOpenAI
 from pydantic import Field
 
 from controlflow.llm.models import BaseChatModel
@@ -71,18 +70,20 @@ class AnthropicRules(LLMRules):
 
 
 def rules_for_model(model: BaseChatModel) -> LLMRules:
-    if isinstance(model, (ChatOpenAI, AzureChatOpenAI)):
+    # a model can only be an instance of a provider's class if that provider's
+    # package was already imported, so check loaded modules instead of
+    # importing every provider package
+    openai = sys.modules.get("langchain_openai")
+    if openai and isinstance(model, (openai.ChatOpenAI, openai.AzureChatOpenAI)):
         return OpenAIRules(model=model)
-    if isinstance(model, ChatAnthropic):
-        return AnthropicRules(model=model)
 
-    try:
-        from langchain_google_vertexai.model_garden import ChatAnthropicVertex
+    anthropic = sys.modules.get("langchain_anthropic")
+    if anthropic and isinstance(model, anthropic.ChatAnthropic):
+        return AnthropicRules(model=model)
 
-        if isinstance(model, ChatAnthropicVertex):
-            return AnthropicRules(model=model)
-    except ImportError:
-        pass
+    vertex = sys.modules.get("langchain_google_vertexai.model_garden")
+    if vertex and isinstance(model, vertex.ChatAnthropicVertex):
+        return AnthropicRules(model=model)
 
     # catchall
     return LLMRules(model=model)
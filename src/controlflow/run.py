@@ -1,5 +1,8 @@
+import asyncio
 from typing import Any, AsyncIterator, Callable, Iterator, Optional, Union
 
+from prefect.utilities.asyncutils import run_coro_as_sync
+
 import controlflow
 from controlflow.agents.agent import Agent
 from controlflow.events.events import Event
@@ -9,9 +12,133 @@ from controlflow.orchestration.handler import AsyncHandler, Handler
 from controlflow.orchestration.orchestrator import Orchestrator, TurnStrategy
 from controlflow.stream import Stream, filter_events_async, filter_events_sync
 from controlflow.tasks.task import Task
+from controlflow.utilities.cache import task_cache_key, task_result_cache
+from controlflow.utilities.general import NOTSET
 from controlflow.utilities.prefect import prefect_task
 
 
+def _cache_key(
+    objective: str,
+    task_kwargs: dict[str, Any],
+    agent: Optional[Agent] = None,
+    model_kwargs: Optional[dict] = None,
+) -> str:
+    task_kwargs = task_kwargs.copy()
+    if task_kwargs.get("agents") is None and agent is not None:
+        task_kwargs["agents"] = [agent]
+    task_kwargs.setdefault("result_type", str)
+    if model_kwargs:
+        task_kwargs["model_kwargs"] = model_kwargs
+    return task_cache_key(objective=objective, **task_kwargs)
+
+
+def _task_results(tasks: list[Task], raise_on_failure: bool) -> list[Any]:
+    if raise_on_failure and any(t.is_failed() for t in tasks):
+        errors = [f"- {t.friendly_name()}: {t.result}" for t in tasks if t.is_failed()]
+        if errors:
+            raise ValueError(
+                f"{len(errors)} task{'s' if len(errors) != 1 else ''} failed: "
+                + "\n".join(errors)
+            )
+
+    return [t.result for t in tasks]
+
+
+def _related_tasks(task: Task) -> set[Task]:
+    """
+    Returns the task and every task an orchestrator could run on its behalf:
+    its subtasks, dependencies, and parents, recursively.
+    """
+    related = set()
+    stack = [task]
+    while stack:
+        current = stack.pop()
+        if current in related:
+            continue
+        related.add(current)
+        stack.extend(current.subtasks)
+        stack.extend(current.depends_on)
+        if current.parent is not None:
+            stack.append(current.parent)
+    return related
+
+
+def _check_independent(tasks: list[Task]) -> None:
+    seen: dict[Task, Task] = {}
+    for task in tasks:
+        if task in seen and seen[task] is task:
+            raise ValueError(
+                f"Task {task.friendly_name()} cannot be run in parallel with "
+                "itself because it was provided more than once."
+            )
+        for related in _related_tasks(task):
+            if (other := seen.setdefault(related, task)) is not task:
+                raise ValueError(
+                    f"Tasks {other.friendly_name()} and {task.friendly_name()} "
+                    "cannot be run in parallel because they share "
+                    f"{related.friendly_name()} through their dependencies, "
+                    "subtasks, or parents."
+                )
+
+
+async def _run_tasks_in_parallel(
+    tasks: list[Task],
+    flow: Flow,
+    agent: Optional[Agent],
+    turn_strategy: Optional[TurnStrategy],
+    handlers: Optional[list[Union[Handler, AsyncHandler]]],
+    max_concurrency: Optional[int],
+    **run_kwargs,
+) -> None:
+    """
+    Run each task with its own orchestrator, concurrently. At most
+    `max_concurrency` orchestrators run at once, if provided.
+
+    Each task runs in its own child flow so that agents only see their own
+    task's messages, and tasks that share dependencies, subtasks, or parents
+    are rejected since their orchestrators would run the shared tasks twice.
+    Once all tasks finish, each child flow's events are copied into the parent
+    flow, one task after another.
+    """
+    _check_independent(tasks)
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    child_flows = [
+        Flow(
+            parent=flow,
+            name=flow.name,
+            description=flow.description,
+            history=flow.history,
+            tools=flow.tools,
+            default_agent=flow.default_agent,
+            prompt=flow.prompt,
+            context=flow.context,
+        )
+        for _ in tasks
+    ]
+
+    async def run_task(task: Task, child_flow: Flow) -> None:
+        orchestrator = Orchestrator(
+            tasks=[task],
+            flow=child_flow,
+            agent=agent,
+            # turn strategies can be stateful, so each orchestrator gets its own
+            turn_strategy=turn_strategy.model_copy() if turn_strategy else None,
+            handlers=handlers,
+        )
+        if semaphore is None:
+            await orchestrator.run_async(**run_kwargs)
+        else:
+            async with semaphore:
+                await orchestrator.run_async(**run_kwargs)
+
+    try:
+        await asyncio.gather(*map(run_task, tasks, child_flows))
+    finally:
+        for child_flow in child_flows:
+            events = child_flow.history.get_events(thread_id=child_flow.thread_id)
+            flow.add_events([event.model_copy() for event in events])
+
+
 def run_tasks(
     tasks: list[Task],
     instructions: str = None,
@@ -25,10 +152,37 @@ def run_tasks(
     model_kwargs: Optional[dict] = None,
     run_until: Optional[Union[RunEndCondition, Callable[[RunContext], bool]]] = None,
     stream: Union[bool, Stream] = False,
+    parallel: bool = False,
+    max_concurrency: Optional[int] = None,
 ) -> Union[list[Any], Iterator[tuple[Event, Any, Optional[Any]]]]:
     """
     Run a list of tasks.
+
+    If `parallel` is True, each task is run by its own orchestrator and the
+    orchestrators run concurrently, with at most `max_concurrency` running at
+    once. This is only appropriate for independent tasks; limits like
+    `max_llm_calls` apply to each task separately.
     """
+    if parallel:
+        return run_coro_as_sync(
+            run_tasks_async(
+                tasks=tasks,
+                instructions=instructions,
+                flow=flow,
+                agent=agent,
+                turn_strategy=turn_strategy,
+                raise_on_failure=raise_on_failure,
+                max_llm_calls=max_llm_calls,
+                max_agent_turns=max_agent_turns,
+                handlers=handlers,
+                model_kwargs=model_kwargs,
+                run_until=run_until,
+                stream=stream,
+                parallel=True,
+                max_concurrency=max_concurrency,
+            )
+        )
+
     flow = flow or get_flow() or Flow()
 
     orchestrator = Orchestrator(
@@ -53,15 +207,7 @@ def run_tasks(
             stream_filter = Stream.ALL if stream is True else stream
             return filter_events_sync(result, stream_filter)
 
-    if raise_on_failure and any(t.is_failed() for t in tasks):
-        errors = [f"- {t.friendly_name()}: {t.result}" for t in tasks if t.is_failed()]
-        if errors:
-            raise ValueError(
-                f"{len(errors)} task{'s' if len(errors) != 1 else ''} failed: "
-                + "\n".join(errors)
-            )
-
-    return [t.result for t in tasks]
+    return _task_results(tasks, raise_on_failure=raise_on_failure)
 
 
 async def run_tasks_async(
@@ -77,11 +223,38 @@ async def run_tasks_async(
     model_kwargs: Optional[dict] = None,
     run_until: Optional[Union[RunEndCondition, Callable[[RunContext], bool]]] = None,
     stream: Union[bool, Stream] = False,
+    parallel: bool = False,
+    max_concurrency: Optional[int] = None,
 ) -> Union[list[Any], AsyncIterator[tuple[Event, Any, Optional[Any]]]]:
     """
     Run a list of tasks asynchronously.
+
+    If `parallel` is True, each task is run by its own orchestrator and the
+    orchestrators run concurrently, with at most `max_concurrency` running at
+    once. This is only appropriate for independent tasks; limits like
+    `max_llm_calls` apply to each task separately.
     """
+    if parallel and stream:
+        raise ValueError("Streaming is not supported when running tasks in parallel.")
+
     flow = flow or get_flow() or Flow()
+
+    if parallel:
+        with controlflow.instructions(instructions):
+            await _run_tasks_in_parallel(
+                tasks=tasks,
+                flow=flow,
+                agent=agent,
+                turn_strategy=turn_strategy,
+                handlers=handlers,
+                max_concurrency=max_concurrency,
+                max_llm_calls=max_llm_calls,
+                max_agent_turns=max_agent_turns,
+                model_kwargs=model_kwargs,
+                run_until=run_until,
+            )
+        return _task_results(tasks, raise_on_failure=raise_on_failure)
+
     orchestrator = Orchestrator(
         tasks=tasks,
         flow=flow,
@@ -104,15 +277,7 @@ async def run_tasks_async(
             stream_filter = Stream.ALL if stream is True else stream
             return filter_events_async(result, stream_filter)
 
-    if raise_on_failure and any(t.is_failed() for t in tasks):
-        errors = [f"- {t.friendly_name()}: {t.result}" for t in tasks if t.is_failed()]
-        if errors:
-            raise ValueError(
-                f"{len(errors)} task{'s' if len(errors) != 1 else ''} failed: "
-                + "\n".join(errors)
-            )
-
-    return [t.result for t in tasks]
+    return _task_results(tasks, raise_on_failure=raise_on_failure)
 
 
 def run(
@@ -126,6 +291,8 @@ def run(
     model_kwargs: Optional[dict] = None,
     run_until: Optional[Union[RunEndCondition, Callable[[RunContext], bool]]] = None,
     stream: Union[bool, Stream] = False,
+    cacheable: bool = False,
+    cache_ttl: Optional[float] = None,
     **task_kwargs,
 ) -> Union[Any, Iterator[tuple[Event, Any, Optional[Any]]]]:
     """
@@ -142,7 +309,19 @@ def run(
         run_until: Condition to stop running the task.
         stream: If True, stream all events. Can also provide StreamFilter flags to filter specific events.
                e.g. StreamFilter.CONTENT | StreamFilter.AGENT_TOOLS
+        cacheable: If True, the result is cached by the task's objective, instructions,
+               context, result type, tools, agents, and model kwargs, and a cached result is returned
+               instead of running the task. Ignored when streaming.
+        cache_ttl: Number of seconds a cached result is valid for. If None, cached results
+               do not expire.
     """
+    cache_key = None
+    if cacheable and not stream:
+        cache_key = _cache_key(objective, task_kwargs, model_kwargs=model_kwargs)
+        result = task_result_cache.get(cache_key, NOTSET)
+        if result is not NOTSET:
+            return result
+
     task = Task(objective=objective, **task_kwargs)
     results = run_tasks(
         tasks=[task],
@@ -157,8 +336,9 @@ def run(
     )
     if stream:
         return results
-    else:
-        return results[0]
+    if cache_key is not None and task.is_successful():
+        task_result_cache.put(cache_key, results[0], ttl=cache_ttl)
+    return results[0]
 
 
 async def run_async(
@@ -174,8 +354,19 @@ async def run_async(
     model_kwargs: Optional[dict] = None,
     run_until: Optional[Union[RunEndCondition, Callable[[RunContext], bool]]] = None,
     stream: Union[bool, Stream] = False,
+    cacheable: bool = False,
+    cache_ttl: Optional[float] = None,
     **task_kwargs,
 ) -> Any:
+    cache_key = None
+    if cacheable and not stream:
+        cache_key = _cache_key(
+            objective, task_kwargs, agent=agent, model_kwargs=model_kwargs
+        )
+        result = task_result_cache.get(cache_key, NOTSET)
+        if result is not NOTSET:
+            return result
+
     task = Task(objective=objective, **task_kwargs)
     results = await run_tasks_async(
         tasks=[task],
@@ -192,5 +383,6 @@ async def run_async(
     )
     if stream:
         return results
-    else:
-        return results[0]
+    if cache_key is not None and task.is_successful():
+        task_result_cache.put(cache_key, results[0], ttl=cache_ttl)
+    return results[0]
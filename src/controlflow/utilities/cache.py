@@ -0,0 +1,108 @@
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+import controlflow
+from controlflow.utilities.general import NOTSET
+
+
+def _tool_name(tool: Any) -> str:
+    return getattr(tool, "name", None) or getattr(tool, "__name__", repr(tool))
+
+
+def _agent_key(agent: Any) -> str:
+    model = agent.model or controlflow.defaults.model
+    return f"{agent.id}:{model!r}"
+
+
+def _dumps(value: Any) -> str:
+    try:
+        return json.dumps(value, sort_keys=True, default=repr)
+    except TypeError:
+        # keys of mixed or non-string types can't be sorted or serialized
+        return repr(value)
+
+
+def task_cache_key(
+    objective: str,
+    name: Optional[str] = None,
+    instructions: Optional[str] = None,
+    context: Optional[dict] = None,
+    result_type: Any = None,
+    tools: Optional[list[Callable]] = None,
+    agents: Optional[list[Any]] = None,
+    **task_kwargs: Any,
+) -> str:
+    """
+    Generates a stable key for a task's result from its objective, name,
+    instructions, context, result type, tools, agents, and any other task
+    kwargs. Agents are keyed by their ID and model. Values that are not JSON
+    serializable are keyed by their repr.
+    """
+    payload = json.dumps(
+        [
+            objective,
+            name,
+            instructions,
+            _dumps(context or {}),
+            repr(result_type),
+            sorted(_tool_name(t) for t in tools or ()),
+            sorted(_agent_key(a) for a in agents or ()),
+            _dumps(task_kwargs),
+        ]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TaskResultCache:
+    """
+    A thread-safe, in-memory LRU cache for task results with optional
+    per-entry TTLs. Values are deep-copied when stored and when retrieved, so
+    callers can't mutate cached results. Subclasses can override `get`, `put`,
+    and `clear` to use a different backend.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[Optional[float], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, NOTSET) is not NOTSET
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+task_result_cache = TaskResultCache()
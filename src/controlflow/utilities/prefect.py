@@ -1,3 +1,4 @@
+import functools
 from contextlib import contextmanager
 from typing import (
     Any,
@@ -181,9 +182,24 @@ def prefect_flow_context(**kwargs):
             f"{unsupported_kwargs}. Consider using a @flow-decorated function instead."
         )
 
+    if not kwargs:
+        return _default_flow_context(controlflow.settings.log_prints)()
+    return _create_flow_context(**kwargs)()
+
+
+def _create_flow_context(**kwargs):
     @contextmanager
     @prefect_flow(**kwargs)
     def flow_context():
         yield
 
-    return flow_context()
+    return flow_context
+
+
+@functools.lru_cache
+def _default_flow_context(log_prints: bool):
+    """
+    Flows enter their Prefect context without kwargs, so the Prefect flow for
+    that case is built once per `log_prints` setting and reused.
+    """
+    return _create_flow_context(log_prints=log_prints)
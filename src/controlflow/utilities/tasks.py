@@ -13,6 +13,9 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 logger = get_logger(__name__)
 
+# values that can never contain a task
+_ATOMIC_TYPES = (str, bytes, int, float, bool, type(None))
+
 
 def visit_task_collection(
     val: Any, visitor: Callable, recursion_limit: int = 10, _counter: int = 0
@@ -30,11 +33,11 @@ def visit_task_collection(
         list["Task"]: The modified task collection after applying the visitor function.
 
     """
-    from controlflow.tasks.task import Task
-
-    if _counter >= recursion_limit:
+    if isinstance(val, _ATOMIC_TYPES) or _counter >= recursion_limit:
         return val
 
+    from controlflow.tasks.task import Task
+
     if isinstance(val, dict):
         result = {}
         for key, value in list(val.items()):
@@ -1,9 +1,12 @@
+import gc
+
 import pytest
 from langchain_anthropic import ChatAnthropic
 from langchain_openai import ChatOpenAI
 
 import controlflow
 from controlflow.agents import Agent
+from controlflow.agents.agent import _tools_cache
 from controlflow.events.base import Event
 from controlflow.events.events import AgentMessage
 from controlflow.instructions import instructions
@@ -70,6 +73,22 @@ class TestAgentInitialization:
 
         assert a1.id != a2.id != a3.id != a4.id
 
+    def test_equivalent_agents_have_same_hash(self):
+        def search():
+            pass
+
+        a1 = Agent(name="Test Agent", tools=[search])
+        a2 = Agent(name="Test Agent", tools=[search])
+        assert a1 == a2
+        assert hash(a1) == hash(a2)
+        assert hash(a1) != hash(Agent(name="Other Agent", tools=[search]))
+
+    def test_hash_is_stable_when_mutated(self):
+        agent = Agent(name="Test Agent")
+        agents = {agent}
+        agent.tools = [lambda: None]
+        assert agent in agents
+
 
 class TestDefaultAgent:
     def test_default_agent(self):
@@ -149,6 +168,54 @@ class TestAgentSerialization:
         assert serialized_tools[0]["description"] == "Dummy tool description"
 
 
+class TestAgentTools:
+    def test_get_tools_is_cached(self):
+        def dummy_tool():
+            """Dummy tool description"""
+
+        agent = Agent(name="Test", tools=[dummy_tool])
+        tools = agent.get_tools()
+        assert [t.name for t in tools] == ["dummy_tool"]
+        assert agent.get_tools() == tools
+        assert agent.get_tools()[0] is tools[0]
+
+    def test_get_tools_does_not_affect_equality(self):
+        def dummy_tool():
+            """Dummy tool description"""
+
+        a1 = Agent(name="Test", tools=[dummy_tool])
+        a2 = Agent(name="Test", tools=a1.tools)
+        a1.get_tools()
+        assert a1 == a2
+        assert hash(a1) == hash(a2)
+
+    def test_get_tools_reflects_changes(self):
+        def dummy_tool():
+            """Dummy tool description"""
+
+        def other_tool():
+            """Other tool description"""
+
+        agent = Agent(name="Test", tools=[dummy_tool])
+        assert [t.name for t in agent.get_tools()] == ["dummy_tool"]
+
+        agent.tools = [dummy_tool, other_tool]
+        assert [t.name for t in agent.get_tools()] == ["dummy_tool", "other_tool"]
+
+    def test_get_tools_cache_is_released(self):
+        agent = Agent(name="Test")
+        agent.get_tools()
+        agent_id = id(agent)
+        assert agent_id in _tools_cache
+
+        del agent
+        gc.collect()
+        assert agent_id not in _tools_cache
+
+        agent.interactive = True
+        assert "cli_input" in [t.name for t in agent.get_tools()]
+
+
 class TestAgentLLMRules:
     def test_get_llm_rules(self):
         agent = Agent(name="Test")
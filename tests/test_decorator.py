@@ -1,6 +1,11 @@
 import asyncio
 
+import prefect
+import pytest
+
 import controlflow
+from controlflow.tasks.task import Task
+from controlflow.utilities.cache import task_result_cache
 
 
 class TestDecorator:
@@ -38,6 +43,55 @@ class TestDecorator:
         task = write_poem.as_task("AI")
         assert task.objective == "Write a poem about `topic`"
 
+    def test_context_from_positional_args(self):
+        @controlflow.task
+        def write_poem(topic: str, lines: int) -> str:
+            """write a poem about `topic`"""
+
+        task = write_poem.as_task("AI", 4)
+        assert task.context == {"topic": "AI", "lines": 4}
+
+    def test_context_from_keyword_args_and_defaults(self):
+        @controlflow.task
+        def write_poem(topic: str, lines: int = 2, *, style: str = "haiku") -> str:
+            """write a poem about `topic`"""
+
+        task = write_poem.as_task(topic="AI")
+        assert task.context == {"topic": "AI", "lines": 2, "style": "haiku"}
+
+    def test_context_from_variadic_args(self):
+        @controlflow.task
+        def summarize(text: str, /, *notes: str, **options: str) -> str:
+            """summarize `text`"""
+
+        task = summarize.as_task("abc", "note", style="brief")
+        assert task.context == {
+            "text": "abc",
+            "notes": ("note",),
+            "options": {"style": "brief"},
+        }
+
+    def test_tools_are_converted_once(self):
+        def search(query: str) -> str:
+            """Search for `query`"""
+
+        @controlflow.task(tools=[search])
+        def research(topic: str) -> str:
+            """research `topic`"""
+
+        task1 = research.as_task("AI")
+        task2 = research.as_task("ML")
+        assert [t.name for t in task1.tools] == ["search"]
+        assert task1.tools[0] is task2.tools[0]
+
+    def test_missing_argument_raises(self):
+        @controlflow.task
+        def write_poem(topic: str) -> str:
+            """write a poem about `topic`"""
+
+        with pytest.raises(TypeError, match=r"write_poem\(\) missing .* 'topic'"):
+            write_poem.as_task()
+
     def test_run_task(self):
         @controlflow.task
         def extract_fruit(text: str) -> list[str]:
@@ -130,6 +184,50 @@ class TestFlowDecorator:
         result = await async_flow_with_context(10, "hello", 3.14)
         assert result == {"a": 10, "b": "hello"}
 
+    def test_flow_decorator_unwraps_prefect_flow(self):
+        @controlflow.flow
+        @prefect.flow(name="my-prefect-flow", retries=2)
+        def prefect_flow(x: int):
+            return controlflow.flows.get_flow().name, x + 10
+
+        assert prefect_flow.name == "my-prefect-flow"
+        assert prefect_flow.retries == 2
+        assert not isinstance(prefect_flow.fn.__wrapped__, prefect.Flow)
+        assert prefect_flow(5) == ("prefect_flow", 15)
+
+    def test_flow_decorator_preserves_prefect_flow_options(self):
+        def on_failure(flow, flow_run, state):
+            pass
+
+        def on_completion(flow, flow_run, state):
+            pass
+
+        @controlflow.flow
+        @prefect.flow(
+            on_failure=[on_failure],
+            on_completion=[on_completion],
+            persist_result=True,
+            validate_parameters=False,
+            cache_result_in_memory=False,
+        )
+        def prefect_flow(x: int):
+            return x + 10
+
+        assert prefect_flow.on_failure_hooks == [on_failure]
+        assert prefect_flow.on_completion_hooks == [on_completion]
+        assert prefect_flow.persist_result is True
+        assert prefect_flow.should_validate_parameters is False
+        assert prefect_flow.cache_result_in_memory is False
+
+    async def test_flow_decorator_unwraps_async_prefect_flow(self):
+        @controlflow.flow
+        @prefect.flow
+        async def async_prefect_flow(x: int):
+            await asyncio.sleep(0.1)
+            return x + 10
+
+        assert await async_prefect_flow(5) == 15
+
 
 class TestTaskDecorator:
     def test_task_decorator_sync_as_task(self):
@@ -165,3 +263,72 @@ class TestTaskDecorator:
             """write a two-line poem about `topic`"""
 
         assert await write_poem("AI")
+
+
+class TestTaskDecoratorCache:
+    @pytest.fixture(autouse=True)
+    def task_runs(self, monkeypatch):
+        task_result_cache.clear()
+        runs = []
+
+        def run(self):
+            runs.append(self)
+            return f"{self.name}: {self.context}"
+
+        async def run_async(self):
+            return run(self)
+
+        monkeypatch.setattr(Task, "run", run)
+        monkeypatch.setattr(Task, "run_async", run_async)
+        yield runs
+        task_result_cache.clear()
+
+    def test_cacheable_task_runs_once(self, task_runs):
+        @controlflow.task(cacheable=True)
+        def summarize(text: str) -> str:
+            pass
+
+        assert summarize("hola") == summarize("hola")
+        assert len(task_runs) == 1
+
+        summarize("hello")
+        assert len(task_runs) == 2
+
+    async def test_cacheable_async_task_runs_once(self, task_runs):
+        @controlflow.task(cacheable=True)
+        async def summarize(text: str) -> str:
+            pass
+
+        assert await summarize("hola") == await summarize("hola")
+        assert len(task_runs) == 1
+
+    def test_task_is_not_cached_by_default(self, task_runs):
+        @controlflow.task
+        def summarize(text: str) -> str:
+            pass
+
+        summarize("hola")
+        summarize("hola")
+        assert len(task_runs) == 2
+
+    def test_functions_without_docstrings_are_cached_separately(self, task_runs):
+        @controlflow.task(cacheable=True)
+        def summarize(text: str) -> str:
+            pass
+
+        @controlflow.task(cacheable=True)
+        def translate(text: str) -> str:
+            pass
+
+        assert summarize("hola").startswith("summarize")
+        assert translate("hola").startswith("translate")
+        assert len(task_runs) == 2
+
+    def test_cache_ttl(self, task_runs):
+        @controlflow.task(cacheable=True, cache_ttl=0)
+        def summarize(text: str) -> str:
+            pass
+
+        summarize("hola")
+        summarize("hola")
+        assert len(task_runs) == 2
@@ -1,3 +1,5 @@
+import importlib
+
 import pytest
 
 import controlflow
@@ -7,8 +9,10 @@ from controlflow.events.events import AgentMessage
 from controlflow.llm.messages import AIMessage
 from controlflow.orchestration.conditions import AnyComplete, AnyFailed, MaxLLMCalls
 from controlflow.orchestration.handler import Handler
+from controlflow.orchestration.orchestrator import Orchestrator
 from controlflow.run import run, run_async, run_tasks, run_tasks_async
 from controlflow.tasks.task import Task
+from controlflow.utilities.cache import task_result_cache
 from tests.fixtures.controlflow import default_fake_llm
 
 
@@ -174,6 +178,170 @@ class TestRunUntilAsync:
         assert task3.is_failed()
 
 
+class TestRunCache:
+    @pytest.fixture(autouse=True)
+    def task_runs(self, monkeypatch):
+        task_result_cache.clear()
+        runs = []
+
+        def run_tasks(tasks, **kwargs):
+            runs.extend(tasks)
+            for task in tasks:
+                task.mark_successful(f"{task.name}: {task.objective}")
+            return [t.result for t in tasks]
+
+        async def run_tasks_async(tasks, **kwargs):
+            return run_tasks(tasks, **kwargs)
+
+        # `controlflow.run` is the function, so load the module explicitly
+        run_module = importlib.import_module("controlflow.run")
+        monkeypatch.setattr(run_module, "run_tasks", run_tasks)
+        monkeypatch.setattr(run_module, "run_tasks_async", run_tasks_async)
+        yield runs
+        task_result_cache.clear()
+
+    def test_cacheable_run(self, task_runs):
+        assert run("say hi", cacheable=True) == run("say hi", cacheable=True)
+        assert len(task_runs) == 1
+
+    async def test_cacheable_run_async(self, task_runs):
+        result = await run_async("say hi", cacheable=True)
+        assert result == await run_async("say hi", cacheable=True)
+        assert len(task_runs) == 1
+
+    def test_run_is_not_cached_by_default(self, task_runs):
+        run("say hi")
+        run("say hi")
+        assert len(task_runs) == 2
+
+    def test_task_kwargs_are_part_of_the_key(self, task_runs):
+        assert run("say hi", name="a", cacheable=True) == "a: say hi"
+        assert run("say hi", name="b", cacheable=True) == "b: say hi"
+        run("say hi", name="b", interactive=True, cacheable=True)
+        assert len(task_runs) == 3
+
+    def test_model_kwargs_are_part_of_the_key(self, task_runs):
+        run("say hi", cacheable=True, model_kwargs={"temperature": 0})
+        run("say hi", cacheable=True, model_kwargs={"temperature": 1})
+        assert len(task_runs) == 2
+
+    def test_failed_runs_are_not_cached(self, task_runs, monkeypatch):
+        def run_tasks(tasks, **kwargs):
+            task_runs.extend(tasks)
+            for task in tasks:
+                task.mark_failed("error")
+            return [t.result for t in tasks]
+
+        monkeypatch.setattr(
+            importlib.import_module("controlflow.run"), "run_tasks", run_tasks
+        )
+        run("say hi", cacheable=True, raise_on_failure=False)
+        run("say hi", cacheable=True, raise_on_failure=False)
+        assert len(task_runs) == 2
+
+
+class TestRunParallel:
+    def test_run_tasks_parallel(self):
+        task1 = Task("Say hello", result_type=str)
+        task2 = Task("Say goodbye", result_type=str)
+
+        results = run_tasks([task1, task2], parallel=True, max_concurrency=2)
+
+        assert task1.is_successful()
+        assert task2.is_successful()
+        assert results == [task1.result, task2.result]
+
+    async def test_run_tasks_async_parallel(self):
+        task1 = Task("Say hello", result_type=str)
+        task2 = Task("Say goodbye", result_type=str)
+
+        results = await run_tasks_async([task1, task2], parallel=True)
+
+        assert task1.is_successful()
+        assert task2.is_successful()
+        assert results == [task1.result, task2.result]
+
+    async def test_parallel_rejects_dependent_tasks(self):
+        task1 = Task("Say hello")
+        task2 = Task("Say goodbye", depends_on=[task1])
+
+        with pytest.raises(ValueError, match="cannot be run in parallel"):
+            await run_tasks_async([task1, task2], parallel=True)
+
+    async def test_parallel_rejects_shared_dependencies(self):
+        shared = Task("Pick a name")
+        task1 = Task("Say hello", depends_on=[shared])
+        task2 = Task("Say goodbye", depends_on=[shared])
+
+        with pytest.raises(ValueError, match="cannot be run in parallel"):
+            await run_tasks_async([task1, task2], parallel=True)
+
+    async def test_parallel_rejects_shared_parent(self):
+        parent = Task("Greet the user")
+        with parent:
+            task1 = Task("Say hello")
+            task2 = Task("Say goodbye")
+
+        with pytest.raises(ValueError, match="cannot be run in parallel"):
+            await run_tasks_async([task1, task2], parallel=True)
+
+    async def test_parallel_tasks_use_separate_flows(self, monkeypatch):
+        flows = []
+
+        async def run_async(self, **kwargs):
+            flows.append(self.flow)
+
+        monkeypatch.setattr(Orchestrator, "run_async", run_async)
+        flow = controlflow.Flow()
+        await run_tasks_async(
+            [Task("Say hello"), Task("Say goodbye")],
+            flow=flow,
+            parallel=True,
+            raise_on_failure=False,
+        )
+
+        assert len(flows) == 2
+        assert flows[0].thread_id != flows[1].thread_id
+        assert all(f.parent is flow for f in flows)
+
+    async def test_parallel_events_are_copied_to_parent_flow(self, monkeypatch):
+        async def run_async(self, **kwargs):
+            self.flow.add_events(
+                [
+                    AgentMessage(
+                        agent=controlflow.defaults.agent,
+                        message=AIMessage(content=self.tasks[0].objective),
+                    )
+                ]
+            )
+
+        monkeypatch.setattr(Orchestrator, "run_async", run_async)
+        flow = controlflow.Flow()
+        await run_tasks_async(
+            [Task("Say hello"), Task("Say goodbye")],
+            flow=flow,
+            parallel=True,
+            raise_on_failure=False,
+        )
+
+        events = flow.get_events()
+        assert sorted(e.message["content"] for e in events) == [
+            "Say goodbye",
+            "Say hello",
+        ]
+        assert all(e.thread_id == flow.thread_id for e in events)
+
+    async def test_parallel_rejects_duplicate_tasks(self):
+        task = Task("Say hello")
+
+        with pytest.raises(ValueError, match="provided more than once"):
+            await run_tasks_async([task, task], parallel=True)
+
+    async def test_parallel_does_not_support_streaming(self):
+        with pytest.raises(ValueError, match="Streaming is not supported"):
+            await run_tasks_async([Task("Say hello")], parallel=True, stream=True)
+
+
 class TestRunStreaming:
     # Helper function to collect async iterator results
     async def collect_stream(self, ait):
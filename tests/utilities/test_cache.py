@@ -0,0 +1,91 @@
+import time
+
+from controlflow.agents import Agent
+from controlflow.utilities.cache import TaskResultCache, task_cache_key
+
+
+class TestTaskCacheKey:
+    def test_key_is_stable(self):
+        assert task_cache_key("objective", context={"a": 1, "b": 2}) == (
+            task_cache_key("objective", context={"b": 2, "a": 1})
+        )
+
+    def test_key_depends_on_context(self):
+        assert task_cache_key("objective", context={"a": 1}) != task_cache_key(
+            "objective", context={"a": 2}
+        )
+
+    def test_key_depends_on_result_type(self):
+        assert task_cache_key("objective", result_type=int) != task_cache_key(
+            "objective", result_type=str
+        )
+
+    def test_key_depends_on_name(self):
+        assert task_cache_key("", name="summarize") != task_cache_key(
+            "", name="translate"
+        )
+
+    def test_key_depends_on_other_task_kwargs(self):
+        assert task_cache_key("objective") != task_cache_key(
+            "objective", interactive=True
+        )
+
+    def test_key_supports_mixed_context_keys(self):
+        assert task_cache_key("objective", context={1: "a", "b": 2}) != (
+            task_cache_key("objective", context={1: "a", "b": 3})
+        )
+
+    def test_key_distinguishes_agents_with_the_same_name(self):
+        assert task_cache_key(
+            "objective", agents=[Agent(name="a", instructions="be brief")]
+        ) != task_cache_key(
+            "objective", agents=[Agent(name="a", instructions="be verbose")]
+        )
+
+    def test_key_ignores_tool_order(self):
+        def tool_a():
+            pass
+
+        def tool_b():
+            pass
+
+        assert task_cache_key("objective", tools=[tool_a, tool_b]) == task_cache_key(
+            "objective", tools=[tool_b, tool_a]
+        )
+
+
+class TestTaskResultCache:
+    def test_get_missing_returns_default(self):
+        cache = TaskResultCache()
+        assert cache.get("missing") is None
+        assert cache.get("missing", 1) == 1
+
+    def test_put_and_get(self):
+        cache = TaskResultCache()
+        cache.put("key", None)
+        assert "key" in cache
+        assert cache.get("key", 1) is None
+
+    def test_ttl_expires(self):
+        cache = TaskResultCache()
+        cache.put("key", "value", ttl=0.01)
+        time.sleep(0.02)
+        assert "key" not in cache
+
+    def test_maxsize_evicts_least_recently_used(self):
+        cache = TaskResultCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_values_are_copied(self):
+        cache = TaskResultCache()
+        value = {"a": [1]}
+        cache.put("key", value)
+        value["a"].append(2)
+        cache.get("key")["a"].append(3)
+        assert cache.get("key") == {"a": [1]}
@@ -0,0 +1,13 @@
+import controlflow
+from controlflow.utilities.prefect import _default_flow_context, prefect_flow_context
+
+
+class TestPrefectFlowContext:
+    def test_default_context_factory_is_reused(self):
+        log_prints = controlflow.settings.log_prints
+        assert _default_flow_context(log_prints) is _default_flow_context(log_prints)
+
+    def test_reused_context_runs_each_time(self):
+        for _ in range(2):
+            with prefect_flow_context():
+                pass
@@ -0,0 +1,22 @@
+from controlflow.tasks.task import Task
+from controlflow.utilities.tasks import collect_tasks, resolve_tasks
+
+
+class TestCollectTasks:
+    def test_collect_tasks_from_nested_collection(self):
+        t1 = Task("Task 1")
+        t2 = Task("Task 2")
+        assert collect_tasks({"a": [t1, "x"], "b": (1, {"c": t2})}) == [t1, t2]
+
+    def test_collect_tasks_from_primitive(self):
+        assert collect_tasks("Task 1") == []
+
+
+class TestResolveTasks:
+    def test_primitives_are_returned_unchanged(self):
+        for val in ["hello", b"hello", 1, 1.5, True, None]:
+            assert resolve_tasks(val) is val
+
+    def test_collections_without_tasks_are_unchanged(self):
+        val = {"a": [1, "b", (2.0, None)], "c": {"d": True}}
+        assert resolve_tasks(val) == val